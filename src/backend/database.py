@@ -11,13 +11,15 @@ db = client['mergington_high']
 activities_collection = db['activities']
 teachers_collection = db['teachers']
 
+# Shared Argon2 hasher (reused instead of re-created on every call)
+_PH = PasswordHasher()
+
 # Methods
 
 
 def hash_password(password):
     """Hash password using Argon2"""
-    ph = PasswordHasher()
-    return ph.hash(password)
+    return _PH.hash(password)
 
 
 def verify_password(hashed_password: str, plain_password: str) -> bool:
@@ -25,14 +27,12 @@ def verify_password(hashed_password: str, plain_password: str) -> bool:
 
     Returns True when the password matches, False otherwise.
     """
-    ph = PasswordHasher()
     try:
-        ph.verify(hashed_password, plain_password)
+        _PH.verify(hashed_password, plain_password)
         return True
-    except argon2_exceptions.VerifyMismatchError:
-        return False
-    except Exception:
-        # For any other exception (e.g., invalid hash), treat as non-match
+    except (argon2_exceptions.VerificationError,
+            argon2_exceptions.InvalidHashError):
+        # Mismatches and malformed hashes are both treated as non-match
         return False
 
 
@@ -40,15 +40,19 @@ def init_database():
     """Initialize database if empty"""
 
     # Initialize activities if empty
-    if activities_collection.count_documents({}) == 0:
-        for name, details in initial_activities.items():
-            activities_collection.insert_one({"_id": name, **details})
+    if activities_collection.find_one({}, {"_id": 1}) is None:
+        activities_collection.insert_many(
+            [{"_id": name, **details} for name, details in initial_activities.items()])
+
+    # Index the fields used to filter the activities listing
+    activities_collection.create_index("schedule_details.days")
+    activities_collection.create_index("schedule_details.start_time")
+    activities_collection.create_index("schedule_details.end_time")
 
     # Initialize teacher accounts if empty
-    if teachers_collection.count_documents({}) == 0:
-        for teacher in initial_teachers:
-            teachers_collection.insert_one(
-                {"_id": teacher["username"], **teacher})
+    if teachers_collection.find_one({}, {"_id": 1}) is None:
+        teachers_collection.insert_many(
+            [{"_id": teacher["username"], **teacher} for teacher in initial_teachers])
 
 
 # Initial database if empty
@@ -187,23 +191,28 @@ initial_activities = {
     }
 }
 
+# Seed passwords are stored pre-hashed so importing this module does no
+# Argon2 work; regenerate with hash_password() if a seed password changes
 initial_teachers = [
     {
         "username": "mrodriguez",
         "display_name": "Ms. Rodriguez",
-        "password": hash_password("art123"),
+        # hash_password("art123")
+        "password": "$argon2id$v=19$m=65536,t=3,p=4$FLjZfgghcF4VkBLep693qQ$mUtc+2z0qXIVQZAtKJu+srlaWV7kug9Wv9ONOaput3Q",
         "role": "teacher"
     },
     {
         "username": "mchen",
         "display_name": "Mr. Chen",
-        "password": hash_password("chess456"),
+        # hash_password("chess456")
+        "password": "$argon2id$v=19$m=65536,t=3,p=4$QPA/UgFEGTN+ZiJ8/s1RIg$b/RNlf5BuDoY+0oCr5RAwwwJGiwyWRikwmFay6kWsYo",
         "role": "teacher"
     },
     {
         "username": "principal",
         "display_name": "Principal Martinez",
-        "password": hash_password("admin789"),
+        # hash_password("admin789")
+        "password": "$argon2id$v=19$m=65536,t=3,p=4$gQ7JEnZja2tqQ8BSh00rCg$Bi3c1JvwqbV9cySLDC0tdmZ6A8gAFvIe5Dm0pPgOLpk",
         "role": "admin"
     }
 ]
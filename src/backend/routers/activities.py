@@ -13,6 +13,13 @@ router = APIRouter(
     tags=["activities"]
 )
 
+# Aggregate to get unique days across all activities
+AVAILABLE_DAYS_PIPELINE = [
+    {"$unwind": "$schedule_details.days"},
+    {"$group": {"_id": "$schedule_details.days"}},
+    {"$sort": {"_id": 1}}  # Sort days alphabetically
+]
+
 
 @router.get("", response_model=Dict[str, Any])
 @router.get("/", response_model=Dict[str, Any])
@@ -32,7 +39,8 @@ def get_activities(
     query = {}
 
     if day:
-        query["schedule_details.days"] = {"$in": [day]}
+        # Equality on an array field matches any element, no $in needed
+        query["schedule_details.days"] = day
 
     if start_time:
         query["schedule_details.start_time"] = {"$gte": start_time}
@@ -52,18 +60,8 @@ def get_activities(
 @router.get("/days", response_model=List[str])
 def get_available_days() -> List[str]:
     """Get a list of all days that have activities scheduled"""
-    # Aggregate to get unique days across all activities
-    pipeline = [
-        {"$unwind": "$schedule_details.days"},
-        {"$group": {"_id": "$schedule_details.days"}},
-        {"$sort": {"_id": 1}}  # Sort days alphabetically
-    ]
-
-    days = []
-    for day_doc in activities_collection.aggregate(pipeline):
-        days.append(day_doc["_id"])
-
-    return days
+    return [day_doc["_id"]
+            for day_doc in activities_collection.aggregate(AVAILABLE_DAYS_PIPELINE)]
 
 
 @router.post("/{activity_name}/signup")
@@ -74,13 +72,15 @@ def signup_for_activity(activity_name: str, email: str, teacher_username: Option
         raise HTTPException(
             status_code=401, detail="Authentication required for this action")
 
-    teacher = teachers_collection.find_one({"_id": teacher_username})
+    teacher = teachers_collection.find_one(
+        {"_id": teacher_username}, {"_id": 1})
     if not teacher:
         raise HTTPException(
             status_code=401, detail="Invalid teacher credentials")
 
     # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
+    activity = activities_collection.find_one(
+        {"_id": activity_name}, {"participants": 1})
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -92,7 +92,7 @@ def signup_for_activity(activity_name: str, email: str, teacher_username: Option
     # Add student to participants
     result = activities_collection.update_one(
         {"_id": activity_name},
-        {"$push": {"participants": email}}
+        {"$addToSet": {"participants": email}}
     )
 
     if result.modified_count == 0:
@@ -110,13 +110,15 @@ def unregister_from_activity(activity_name: str, email: str, teacher_username: O
         raise HTTPException(
             status_code=401, detail="Authentication required for this action")
 
-    teacher = teachers_collection.find_one({"_id": teacher_username})
+    teacher = teachers_collection.find_one(
+        {"_id": teacher_username}, {"_id": 1})
     if not teacher:
         raise HTTPException(
             status_code=401, detail="Invalid teacher credentials")
 
     # Get the activity
-    activity = activities_collection.find_one({"_id": activity_name})
+    activity = activities_collection.find_one(
+        {"_id": activity_name}, {"participants": 1})
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -35,7 +35,7 @@ def login(username: str, password: str) -> Dict[str, Any]:
 @router.get("/check-session")
 def check_session(username: str) -> Dict[str, Any]:
     """Check if a session is valid by username"""
-    teacher = teachers_collection.find_one({"_id": username})
+    teacher = teachers_collection.find_one({"_id": username}, {"password": 0})
 
     if not teacher:
         raise HTTPException(status_code=404, detail="Teacher not found")